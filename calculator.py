@@ -1,5 +1,169 @@
+import operator
+import re
+from functools import lru_cache, partial
 from tkinter import Tk, Entry, Button, StringVar, Frame
-from typing import Optional, Union, List, Tuple
+from typing import (
+    Any, Callable, Dict, Iterable, Optional, Union, List, Tuple
+)
+
+
+# ------------------ Expression Evaluation ------------------
+
+_BINOPS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '**': operator.pow,
+    '//': operator.floordiv,
+}
+
+_UNOPS: Dict[str, Callable[[Any], Any]] = {
+    '+': operator.pos,
+    '-': operator.neg,
+}
+
+# Binding strength of each operator, following Python's rules: unary
+# signs bind tighter than '*' but looser than '**', which is also the
+# only right-associative operator.
+_PRECEDENCE: Dict[str, int] = {
+    '+': 1, '-': 1,
+    '*': 2, '/': 2, '//': 2, '%': 2,
+    '**': 4,
+}
+_UNARY_PRECEDENCE = 3
+
+# Characters that may appear in an expression at all. Anything else is
+# rejected before tokenizing.
+_ALLOWED = frozenset('0123456789+-*/().% ')
+
+# Each match yields either a number or an operator/parenthesis token.
+_TOKEN_RE = re.compile(
+    r' *(?:([0-9]+\.?[0-9]*|\.[0-9]+)|(\*\*|//|[-+*/%()]))'
+)
+
+_Program = Tuple[Tuple[str, Any], ...]
+
+
+def _emit(entry: Tuple[str, bool], ops: List[Tuple[str, Any]]) -> None:
+    """
+    Append the instruction for a pending operator to the program.
+
+    Args:
+        entry (Tuple[str, bool]): The operator token and whether it is
+            used as a unary sign.
+        ops (List[Tuple[str, Any]]): The instruction list to extend.
+    """
+    token, unary = entry
+    if unary:
+        ops.append(('U', _UNOPS[token]))
+    else:
+        ops.append(('B', _BINOPS[token]))
+
+
+@lru_cache(maxsize=256)
+def _compile(expr: str) -> _Program:
+    """
+    Tokenize and compile an arithmetic expression.
+
+    Uses the shunting-yard algorithm to turn the infix expression into a
+    postfix stack-machine program. Results are cached per expression
+    string, so pressing '=' again on the same entry skips this entirely.
+
+    Args:
+        expr (str): The expression to compile.
+
+    Returns:
+        _Program: The stack-machine instructions for the expression.
+
+    Raises:
+        ValueError: If the expression is empty, malformed, or contains
+            anything besides numbers, parentheses and the operators in
+            `_BINOPS` and `_UNOPS`.
+    """
+    if not _ALLOWED.issuperset(expr):
+        raise ValueError(f"Unsupported characters in {expr!r}")
+
+    ops: List[Tuple[str, Any]] = []
+    pending: List[Tuple[str, bool]] = []
+    expect_operand = True
+    pos, end = 0, len(expr.rstrip(' '))
+
+    while pos < end:
+        match = _TOKEN_RE.match(expr, pos)
+        if match is None:
+            raise ValueError(f"Unexpected input at position {pos}: {expr!r}")
+        pos = match.end()
+        number, symbol = match.groups()
+
+        if number is not None:
+            if not expect_operand:
+                raise ValueError(f"Missing operator before {number!r}")
+            ops.append(('N', float(number) if '.' in number else int(number)))
+            expect_operand = False
+        elif symbol == '(':
+            if not expect_operand:
+                raise ValueError("Missing operator before '('")
+            pending.append((symbol, False))
+        elif symbol == ')':
+            if expect_operand:
+                raise ValueError("Missing operand before ')'")
+            while pending and pending[-1][0] != '(':
+                _emit(pending.pop(), ops)
+            if not pending:
+                raise ValueError("Unbalanced ')'")
+            pending.pop()
+        elif expect_operand:
+            if symbol not in _UNOPS:
+                raise ValueError(f"Missing operand before {symbol!r}")
+            pending.append((symbol, True))
+        else:
+            precedence = _PRECEDENCE[symbol]
+            while pending and pending[-1][0] != '(':
+                top, unary = pending[-1]
+                top_precedence = (
+                    _UNARY_PRECEDENCE if unary else _PRECEDENCE[top]
+                )
+                if top_precedence < precedence or (
+                    top_precedence == precedence and symbol == '**'
+                ):
+                    break
+                _emit(pending.pop(), ops)
+            pending.append((symbol, False))
+            expect_operand = True
+
+    if expect_operand:
+        raise ValueError(f"Incomplete expression: {expr!r}")
+    while pending:
+        if pending[-1][0] == '(':
+            raise ValueError("Unbalanced '('")
+        _emit(pending.pop(), ops)
+    return tuple(ops)
+
+
+def _run(program: _Program) -> Any:
+    """
+    Execute a program produced by `_compile`.
+
+    Args:
+        program (_Program): The instructions to execute.
+
+    Returns:
+        Any: The value left on the stack.
+    """
+    stack: List[Any] = []
+    push = stack.append
+    pop = stack.pop
+    for tag, arg in program:
+        if tag == 'N':
+            push(arg)
+        elif tag == 'U':
+            push(arg(pop()))
+        else:
+            right = pop()
+            push(arg(pop(), right))
+    return stack[0]
 
 
 # ------------------ Base Logic ------------------
@@ -12,17 +176,57 @@ class CalculatorBase:
     and evaluate mathematical expressions.
     """
 
+    __slots__ = ('_parts', '_text', '_float')
+
     def __init__(self) -> None:
         """Initialize the calculator with an empty entry value."""
-        self.entry_value: str = ""
+        self._parts: List[str] = []
+        self._text: Optional[str] = ""
+        self._float: Optional[float] = None
+
+    @property
+    def entry_value(self) -> str:
+        """
+        The current entry, joined from the appended parts.
+
+        The joined string is kept until the next `append`, so repeated
+        reads of an unchanged entry do not join it again.
+        """
+        if self._text is None:
+            self._text = "".join(self._parts)
+        return self._text
+
+    @entry_value.setter
+    def entry_value(self, value: str) -> None:
+        self._parts = [value] if value else []
+        self._text = value
+        self._float = None
 
     def append(self, value: Union[str, int, float]) -> None:
         """Append a value to the current entry."""
-        self.entry_value += str(value)
+        self._parts.append(str(value))
+        self._text = None
+        self._float = None
 
     def clear(self) -> None:
         """Clear the current entry."""
-        self.entry_value = ""
+        self._parts.clear()
+        self._text = ""
+        self._float = None
+
+    def as_float(self) -> float:
+        """
+        Return the current entry parsed as a number.
+
+        The parsed value is cached until the entry changes, so chaining
+        several conversions on the same entry parses it only once.
+
+        Raises:
+            ValueError: If the entry is not a valid number.
+        """
+        if self._float is None:
+            self._float = float(self.entry_value)
+        return self._float
 
     def solve(self) -> Union[str, float]:
         """
@@ -33,13 +237,24 @@ class CalculatorBase:
             float: The result of the valid mathematical expression.
         """
         try:
-            return float(eval(self.entry_value))
+            return float(_run(_compile(self.entry_value)))
         except Exception:
             return "Error"
 
 
 # ------------------ Conversion Logic ------------------
 
+# Reciprocals are precomputed so the strategies multiply instead of divide.
+_KM_PER_MILE = 1.60934
+_MILES_PER_KM = 1.0 / _KM_PER_MILE
+_F_PER_C = 9.0 / 5.0
+_C_PER_F = 5.0 / 9.0
+_CM_PER_INCH = 2.54
+_INCHES_PER_CM = 0.3937
+_SEC_PER_MIN = 60.0
+_MIN_INV = 1.0 / _SEC_PER_MIN
+
+
 class ConversionStrategy:
     """
     Defines a common interface for all conversion strategies.
@@ -57,61 +272,77 @@ class ConversionStrategy:
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def convert_batch(self, values: Iterable[float]) -> List[float]:
+        """
+        Perform the conversion on several values at once.
+
+        The bound `convert` method is looked up once for the whole batch
+        rather than once per value.
+
+        Args:
+            values (Iterable[float]): The values to convert.
+
+        Returns:
+            List[float]: The converted values, in input order.
+        """
+        convert = self.convert
+        return [convert(value) for value in values]
+
 
 class MilesToKmStrategy(ConversionStrategy):
     """Strategy for converting miles to kilometers."""
 
     def convert(self, value: float) -> float:
-        return value * 1.60934
+        return value * _KM_PER_MILE
 
 
 class KmToMilesStrategy(ConversionStrategy):
     """Strategy for converting kilometers to miles."""
 
     def convert(self, value: float) -> float:
-        return value / 1.60934
+        return value * _MILES_PER_KM
 
 
 class CelsiusToFahrenheitStrategy(ConversionStrategy):
     """Strategy for converting Celsius to Fahrenheit."""
 
     def convert(self, value: float) -> float:
-        return (value * 9 / 5) + 32
+        return value * _F_PER_C + 32.0
 
 
 class FahrenheitToCelsiusStrategy(ConversionStrategy):
     """Strategy for converting Fahrenheit to Celsius."""
 
     def convert(self, value: float) -> float:
-        return (value - 32) * 5 / 9
+        return (value - 32.0) * _C_PER_F
 
 
 class InchesToCentimetersStrategy(ConversionStrategy):
     """Strategy for converting Inches to Centimeters."""
 
     def convert(self, value: float) -> float:
-        return value * 2.54
+        return value * _CM_PER_INCH
 
 
 class CentimetersToInchesStrategy(ConversionStrategy):
     """Strategy for converting Centimeters to Inches."""
 
     def convert(self, value: float) -> float:
-        return value * 0.3937
+        return value * _INCHES_PER_CM
 
 
 class MinutesToSecondsStrategy(ConversionStrategy):
     """Strategy for converting minutes to seconds."""
 
     def convert(self, value: float) -> float:
-        return value * 60
+        return value * _SEC_PER_MIN
 
 
 class SecondsToMinutesStrategy(ConversionStrategy):
     """Strategy for converting seconds to minutes."""
 
     def convert(self, value: float) -> float:
-        return value / 60
+        return value * _MIN_INV
 
 
 class ConversionContext:
@@ -152,8 +383,27 @@ class ConversionContext:
         return self.strategy.convert(value)
 
 
+# Every supported conversion is affine, so each one is stored as a
+# (scale, offset) pair and applied as `value * scale + offset`.
+_CONVERSION_FACTORS: Dict[str, Tuple[float, float]] = {
+    "Mi to Km": (_KM_PER_MILE, 0.0),
+    "Km to Mi": (_MILES_PER_KM, 0.0),
+    "C to F": (_F_PER_C, 32.0),
+    "F to C": (_C_PER_F, -32.0 * _C_PER_F),
+    "In to Cm": (_CM_PER_INCH, 0.0),
+    "Cm to In": (_INCHES_PER_CM, 0.0),
+    "Min to Sec": (_SEC_PER_MIN, 0.0),
+    "Sec to Min": (_MIN_INV, 0.0),
+}
+
+
 # ------------------ Modes for Buttons ------------------
 
+# Layout entries are (text, row, column, kind), where kind is 0 for a
+# standard button and 1 for a conversion button.
+_Layout = Tuple[Tuple[str, int, int, int], ...]
+
+
 class CalculatorMode:
     """
     Defines a common interface for calculator modes.
@@ -162,7 +412,7 @@ class CalculatorMode:
     represents a different state with its own behavior for button creation.
     """
 
-    def create_buttons(self) -> List[Tuple[str, int, int]]:
+    def create_buttons(self) -> _Layout:
         """Create the button layout for the mode."""
         raise NotImplementedError("Subclasses must implement this method.")
 
@@ -170,30 +420,34 @@ class CalculatorMode:
 class StandardMode(CalculatorMode):
     """Defines buttons for the standard calculator mode."""
 
-    def create_buttons(self) -> List[Tuple[str, int, int]]:
-        return [
-            ('(', 0, 0), (')', 0, 1), ('%', 0, 2), ('/', 0, 3),
-            ('7', 1, 0), ('8', 1, 1), ('9', 1, 2), ('*', 1, 3),
-            ('4', 2, 0), ('5', 2, 1), ('6', 2, 2), ('-', 2, 3),
-            ('1', 3, 0), ('2', 3, 1), ('3', 3, 2), ('+', 3, 3),
-            ('0', 4, 0), ('C', 4, 1), ('.', 4, 2), ('=', 4, 3),
-        ]
+    BUTTONS: _Layout = (
+        ('(', 0, 0, 0), (')', 0, 1, 0), ('%', 0, 2, 0), ('/', 0, 3, 0),
+        ('7', 1, 0, 0), ('8', 1, 1, 0), ('9', 1, 2, 0), ('*', 1, 3, 0),
+        ('4', 2, 0, 0), ('5', 2, 1, 0), ('6', 2, 2, 0), ('-', 2, 3, 0),
+        ('1', 3, 0, 0), ('2', 3, 1, 0), ('3', 3, 2, 0), ('+', 3, 3, 0),
+        ('0', 4, 0, 0), ('C', 4, 1, 0), ('.', 4, 2, 0), ('=', 4, 3, 0),
+    )
+
+    def create_buttons(self) -> _Layout:
+        return self.BUTTONS
 
 
 class ConvertMode(CalculatorMode):
     """Defines buttons for the conversion calculator mode."""
 
-    def create_buttons(self) -> List[Tuple[str, int, int]]:
-        return [
-            ('7', 1, 0), ('8', 1, 1), ('9', 1, 2),
-            ('4', 2, 0), ('5', 2, 1), ('6', 2, 2),
-            ('1', 3, 0), ('2', 3, 1), ('3', 3, 2),
-            ('C', 4, 0), ('0', 4, 1), ('.', 4, 2),
-            ('Mi to Km', 0, 0), ('Km to Mi', 0, 1),
-            ('C to F', 0, 2), ('F to C', 0, 3),
-            ('In to Cm', 1, 3), ('Cm to In', 2, 3),
-            ('Min to Sec', 3, 3), ('Sec to Min', 4, 3)
-        ]
+    BUTTONS: _Layout = (
+        ('7', 1, 0, 0), ('8', 1, 1, 0), ('9', 1, 2, 0),
+        ('4', 2, 0, 0), ('5', 2, 1, 0), ('6', 2, 2, 0),
+        ('1', 3, 0, 0), ('2', 3, 1, 0), ('3', 3, 2, 0),
+        ('C', 4, 0, 0), ('0', 4, 1, 0), ('.', 4, 2, 0),
+        ('Mi to Km', 0, 0, 1), ('Km to Mi', 0, 1, 1),
+        ('C to F', 0, 2, 1), ('F to C', 0, 3, 1),
+        ('In to Cm', 1, 3, 1), ('Cm to In', 2, 3, 1),
+        ('Min to Sec', 3, 3, 1), ('Sec to Min', 4, 3, 1)
+    )
+
+    def create_buttons(self) -> _Layout:
+        return self.BUTTONS
 
 
 # ------------------ Mediator ------------------
@@ -208,70 +462,88 @@ class AppMediator:
 
     def __init__(self, master: Tk) -> None:
         self.calculator = CalculatorBase()
-        self.conversion_context = ConversionContext()
-        self.mode: CalculatorMode = StandardMode()
+        self._standard_mode = StandardMode()
+        self._convert_mode = ConvertMode()
+        self.mode: CalculatorMode = self._standard_mode
         self.display = Display(master, self)
         self.button_manager = ButtonManager(master, self)
 
     def set_standard_mode(self) -> None:
         """Set the calculator to Standard mode."""
-        self.mode = StandardMode()
+        self.mode = self._standard_mode
         self.button_manager.update_buttons()
 
     def set_convert_mode(self) -> None:
         """Set the calculator to Convert mode."""
-        self.mode = ConvertMode()
+        self.mode = self._convert_mode
         self.button_manager.update_buttons()
 
     def handle_clear(self) -> None:
         """Clear the calculator display."""
         self.calculator.clear()
-        self.display.update_display("")
+        self.display.update_display_str("")
 
     def handle_equal(self) -> None:
         """Evaluate and display the result of the current equation."""
         result = self.calculator.solve()
-        self.display.update_display(result)
+        if isinstance(result, str):
+            self.display.update_display_str(result)
+        else:
+            self.display.update_display_number(result)
 
     def handle_append(self, value: str) -> None:
         """Append a value to the calculator's entry."""
         self.calculator.append(value)
-        self.display.update_display(self.calculator.entry_value)
+        self.display.update_display_str(self.calculator.entry_value)
 
     def handle_conversion(self, operation: str) -> None:
         """
         Execute a conversion operation using the appropriate strategy.
 
+        The factors in `_CONVERSION_FACTORS` are applied directly instead
+        of dispatching through a strategy object on every press.
+
+        Unknown operations and invalid entries both display 'Error'.
+
         Args:
             operation (str): The name of the conversion operation.
         """
         try:
-            value = float(self.calculator.entry_value)
-            strategy_map = {
-                "Mi to Km": MilesToKmStrategy(),
-                "Km to Mi": KmToMilesStrategy(),
-                "C to F": CelsiusToFahrenheitStrategy(),
-                "F to C": FahrenheitToCelsiusStrategy(),
-                "In to Cm": InchesToCentimetersStrategy(),
-                "Cm to In": CentimetersToInchesStrategy(),
-                "Min to Sec": MinutesToSecondsStrategy(),
-                "Sec to Min": SecondsToMinutesStrategy()
-            }
-            self.conversion_context.set_strategy(strategy_map[operation])
-            result = self.conversion_context.execute_conversion(value)
-            self.display.update_display(result)
+            value = self.calculator.as_float()
         except ValueError:
-            self.display.update_display("Error")
+            self.display.update_display_str("Error")
+            return
+        factors = _CONVERSION_FACTORS.get(operation)
+        if factors is None:
+            self.display.update_display_str("Error")
+            return
+        scale, offset = factors
+        self.display.update_display_number(value * scale + offset)
 
 
 # ------------------ UI Components ------------------
 
+_STD_STYLE: Dict[str, Any] = {
+    'width': 7, 'height': 4, 'relief': 'flat',
+    'bg': '#7A8450', 'activebackground': '#AEBD93', 'fg': 'white',
+    'bd': 0, 'highlightbackground': '#484F2B', 'highlightcolor': '#7A8450',
+}
+
+_CONV_STYLE: Dict[str, Any] = {
+    'width': 7, 'height': 4, 'relief': 'flat',
+    'bg': '#AEBD93', 'activebackground': '#7A8450', 'fg': 'black',
+    'activeforeground': 'white', 'bd': 0, 'highlightbackground': 'white',
+    'highlightcolor': '#7A8450',
+}
+
+
 class Display:
     """Handles the display and menu."""
 
     def __init__(self, master: Tk, mediator: AppMediator) -> None:
         self.mediator = mediator
         self.equation = StringVar(value="")
+        self._fmt_cache: Dict[Tuple[type, Union[int, float]], str] = {}
         self.create_display(master)
         self.create_menu(master)
         self.configure_window(master)
@@ -308,65 +580,102 @@ class Display:
 
     def update_display(self, value: Union[str, int, float]) -> None:
         """Update the display with a given value."""
-        if isinstance(value, int):
-            self.equation.set(str(value))
-        elif isinstance(value, float):
-            if value.is_integer():
-                self.equation.set(str(int(value)))
-            else:
-                self.equation.set(f"{value:.3f}")
+        if isinstance(value, str):
+            self.update_display_str(value)
         else:
-            self.equation.set(str(value))
+            self.update_display_number(value)
+
+    def update_display_str(self, text: str) -> None:
+        """Update the display with a string, such as the current entry."""
+        self.equation.set(text)
+
+    def update_display_number(self, value: Union[int, float]) -> None:
+        """
+        Update the display with a numeric result.
+
+        Recent results are kept formatted in a small cache, since pressing
+        '=' repeatedly often shows the same value again.
+        """
+        key = (type(value), value)
+        text = self._fmt_cache.get(key)
+        if text is None:
+            if isinstance(value, int):
+                text = str(value)
+            elif value.is_integer():
+                text = str(int(value))
+            else:
+                text = f"{value:.3f}"
+            if len(self._fmt_cache) >= 32:
+                self._fmt_cache.clear()
+            self._fmt_cache[key] = text
+        self.equation.set(text)
 
 
 class ButtonManager:
-    """Handles button creation and management."""
+    """
+    Handles button creation and management.
+
+    Both mode layouts are built once at startup, each in its own frame;
+    switching modes only swaps which frame is placed.
+    """
 
     def __init__(self, master: Tk, mediator: AppMediator) -> None:
         self.mediator = mediator
         self.button_frame = Frame(master, bg='#484F2B')
         self.button_frame.place(x=10, y=125, width=360, height=440)
+
+        # Button callbacks are created once and looked up by button text.
+        self._commands: Dict[str, Callable[[], None]] = {
+            'C': mediator.handle_clear,
+            '=': mediator.handle_equal,
+        }
+        for text in '0123456789.+-*/%()':
+            self._commands[text] = partial(mediator.handle_append, text)
+        for text in _CONVERSION_FACTORS:
+            self._commands[text] = partial(mediator.handle_conversion, text)
+
+        self._std_frame = Frame(self.button_frame, bg='#484F2B')
+        self._conv_frame = Frame(self.button_frame, bg='#484F2B')
+        self._build_layout(self._std_frame, StandardMode.BUTTONS)
+        self._build_layout(self._conv_frame, ConvertMode.BUTTONS)
+        self._active_frame: Optional[Frame] = None
         self.update_buttons()
 
-    def update_buttons(self) -> None:
-        """Create buttons dynamically based on the current mode."""
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
-
-        buttons = self.mediator.mode.create_buttons()
-        for text, row, col in buttons:
-            if "to" in text:
-                self.create_conversion_button(text, row, col)
-            else:
-                self.create_standard_button(text, row, col)
+    def _build_layout(self, frame: Frame, buttons: _Layout) -> None:
+        """Create every button of a layout inside the given frame."""
+        ctors = (self.create_standard_button, self.create_conversion_button)
+        for text, row, col, kind in buttons:
+            ctors[kind](frame, text, row, col)
 
-    def create_standard_button(self, text: str, row: int, col: int) -> None:
+    def update_buttons(self) -> None:
+        """Show the button layout of the current mode."""
+        if isinstance(self.mediator.mode, StandardMode):
+            frame = self._std_frame
+        else:
+            frame = self._conv_frame
+        if frame is self._active_frame:
+            return
+        # The hidden layout is unmapped rather than covered, so Tab focus
+        # traversal cannot reach its buttons.
+        if self._active_frame is not None:
+            self._active_frame.place_forget()
+        frame.place(x=0, y=0, relwidth=1, relheight=1)
+        self._active_frame = frame
+
+    def create_standard_button(
+        self, frame: Frame, text: str, row: int, col: int
+    ) -> None:
         """Create a standard calculator button."""
-        def handle_command() -> None:
-            if text == 'C':
-                self.mediator.handle_clear()
-            elif text == '=':
-                self.mediator.handle_equal()
-            else:
-                self.mediator.handle_append(text)
-
         Button(
-            self.button_frame, width=7, height=4, text=text, relief='flat',
-            bg='#7A8450', activebackground='#AEBD93', fg='white',
-            bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
-            command=handle_command
+            frame, text=text, command=self._commands[text], **_STD_STYLE
         ).grid(column=col, row=row, padx=4, pady=4)
 
-    def create_conversion_button(self, text: str, row: int, col: int) -> None:
+    def create_conversion_button(
+        self, frame: Frame, text: str, row: int, col: int
+    ) -> None:
         """Create a conversion calculator button."""
-        def handle_conversion() -> None:
-            self.mediator.handle_conversion(text)
-
         Button(
-            self.button_frame, width=7, height=4, text=text, relief='flat',
-            bg='#AEBD93', activebackground='#7A8450', fg='black',
-            activeforeground='white', bd=0, highlightbackground='white',
-            highlightcolor='#7A8450', command=handle_conversion
+            frame, text=text, command=self._commands[text], **_CONV_STYLE
         ).grid(column=col, row=row, padx=4, pady=4)
 
 
@@ -1,6 +1,8 @@
-import unittest
-from unittest.mock import Mock, patch
-from tkinter import Tk as tk, StringVar
+from math import isclose
+
+import pytest
+from unittest.mock import ANY, Mock, patch
+from tkinter import Tk, TclError, Toplevel, StringVar
 from calculator import (
     CalculatorBase,
     ConversionContext,
@@ -18,366 +20,625 @@ from calculator import (
     ConvertMode,
     AppMediator,
     Display,
-    ButtonManager
+    ButtonManager,
+    _CONVERSION_FACTORS,
+    _compile
+)
+
+
+try:
+    from hypothesis import Phase, given, settings, strategies as st
+except ImportError:
+    # Hypothesis is optional: without it the property tests are skipped
+    # and the plain unit tests still run.
+    def given(*args, **kwargs):
+        return pytest.mark.skip(reason="hypothesis is not installed")
+
+    def settings(*args, **kwargs):
+        return lambda test: test
+
+    class st:
+        """Stand-in so the arguments to @given still evaluate."""
+        text = integers = floats = staticmethod(lambda *a, **k: None)
+else:
+    # No example database or deadlines, and fewer examples than
+    # Hypothesis' default of 100: every property here is cheap and
+    # deterministic. Runs are derandomized and skip the reuse and shrink
+    # phases, so the same examples are generated every time and a
+    # failure is reported as drawn.
+    settings.register_profile(
+        "fast", database=None, deadline=None, max_examples=25,
+        derandomize=True, phases=[Phase.explicit, Phase.generate]
+    )
+    settings.load_profile("fast")
+
+
+# Under pytest-xdist the property tests all run on one worker.
+_HYPOTHESIS_GROUP = pytest.mark.xdist_group("hypothesis")
+
+# Strategies hold no state, so the tests share one instance of each.
+_MI2KM = MilesToKmStrategy()
+_KM2MI = KmToMilesStrategy()
+_C2F = CelsiusToFahrenheitStrategy()
+_F2C = FahrenheitToCelsiusStrategy()
+_IN2CM = InchesToCentimetersStrategy()
+_CM2IN = CentimetersToInchesStrategy()
+_MIN2SEC = MinutesToSecondsStrategy()
+_SEC2MIN = SecondsToMinutesStrategy()
+
+
+# Starting a Tcl interpreter is slow, so every Tk-based test shares one
+# hidden root and only creates a cheap Toplevel window of its own. On a
+# headless machine the Tk-based tests are skipped instead of erroring.
+@pytest.fixture(scope="module")
+def root():
+    try:
+        root = Tk()
+    except TclError as error:
+        pytest.skip(f"Tk is unavailable: {error}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def master(root):
+    window = Toplevel(root)
+    yield window
+    window.destroy()
+
+
+# Tests for the CalculatorBase class.
+
+@pytest.fixture(scope="module")
+def calc():
+    return CalculatorBase()
+
+
+def test_append_value(calc):
+    calc.clear()
+    calc.append("5")
+    assert calc.entry_value == "5"
+
+
+def test_append_multiple_values(calc):
+    calc.clear()
+    calc.append("1")
+    calc.append(2)
+    calc.append(".5")
+    assert calc.entry_value == "12.5"
+    calc.entry_value = "7"
+    calc.append("8")
+    assert calc.entry_value == "78"
+
+
+def test_entry_value_joined_once_per_change(calc):
+    calc.clear()
+    calc.append("4")
+    calc.append("2")
+    first = calc.entry_value
+    assert calc.entry_value is first
+    calc.append("0")
+    assert calc.entry_value == "420"
+
+
+def test_as_float(calc):
+    calc.clear()
+    calc.append("2.5")
+    with patch("calculator.float", create=True, wraps=float) as parse:
+        assert calc.as_float() == 2.5
+        assert calc.as_float() == 2.5
+        assert parse.call_count == 1
+    calc.append("1")
+    assert calc._float is None
+    assert calc.as_float() == 2.51
+    calc.entry_value = "4"
+    assert calc._float is None
+    assert calc.as_float() == 4.0
+    calc.clear()
+    assert calc._float is None
+    with pytest.raises(ValueError):
+        calc.as_float()
+
+
+def test_clear_entry(calc):
+    calc.clear()
+    calc.append("123")
+    calc.clear()
+    assert calc.entry_value == ""
+
+
+@pytest.mark.parametrize("expr, expected", [
+    pytest.param("2+2", 4, id="valid"),
+    pytest.param("5/0", "Error", id="invalid"),
+    pytest.param("", "Error", id="empty"),
+])
+def test_solve(calc, expr, expected):
+    calc.clear()
+    calc.append(expr)
+    assert calc.solve() == expected
+
+
+def test_solve_operator_precedence(calc):
+    calc.clear()
+    calc.append("2+3*4-(1+1)")
+    assert calc.solve() == 12
+
+
+def test_solve_unary_operators(calc):
+    calc.clear()
+    calc.append("-(2+3)*+2")
+    assert calc.solve() == -10
+
+
+def test_solve_power_and_floor_division(calc):
+    calc.clear()
+    calc.append("-2**2+2**3**2+7//2")
+    assert calc.solve() == 511
+
+
+@pytest.mark.parametrize(
+    "expression", ["(1+2", "1+2)", "2(3)", "1+", "*2", "1.2.3"]
 )
-from hypothesis import given, strategies as st
-
-
-class TestCalculatorBase(unittest.TestCase):
-    """Tests for the CalculatorBase class."""
-
-    def setUp(self) -> None:
-        self.calculator = CalculatorBase()
-
-    def test_append_value(self):
-        self.calculator.append("5")
-        self.assertEqual(self.calculator.entry_value, "5")
-
-    def test_clear_entry(self):
-        self.calculator.append("123")
-        self.calculator.clear()
-        self.assertEqual(self.calculator.entry_value, "")
-
-    def test_solve_valid_expression(self):
-        self.calculator.append("2+2")
-        result = self.calculator.solve()
-        self.assertEqual(result, 4)
-
-    def test_solve_invalid_expression(self):
-        self.calculator.append("5/0")
-        result = self.calculator.solve()
-        self.assertEqual(result, "Error")
-
-    def test_solve_empty_expression(self):
-        result = self.calculator.solve()
-        self.assertEqual(result, "Error")
-
-    @given(st.text())
-    def test_solve_random_expressions(self, expression):
-        """Property-based test to ensure no crashes on arbitrary input."""
-        self.calculator.entry_value = expression
-        result = self.calculator.solve()
-        self.assertTrue(isinstance(result, (str, int, float)))
-
-
-class TestConversionStrategy(unittest.TestCase):
-    def test_convert_not_implemented(self):
-        strategy = ConversionStrategy()
-        with self.assertRaises(NotImplementedError):
-            strategy.convert(5.6)
-
-
-class TestConversionStrategies(unittest.TestCase):
-    """Tests for conversion strategies."""
-
-    def test_miles_to_km(self):
-        strategy = MilesToKmStrategy()
-        self.assertAlmostEqual(strategy.convert(1), 1.60934)
-        self.assertAlmostEqual(strategy.convert(0), 0)
-        self.assertAlmostEqual(strategy.convert(-1), -1.60934)
-
-    def test_km_to_miles(self):
-        strategy = KmToMilesStrategy()
-        self.assertAlmostEqual(strategy.convert(1.60934), 1)
-        self.assertAlmostEqual(strategy.convert(0), 0)
-        self.assertAlmostEqual(strategy.convert(-1.60934), -1)
-
-    def test_celsius_to_fahrenheit(self):
-        strategy = CelsiusToFahrenheitStrategy()
-        self.assertAlmostEqual(strategy.convert(0), 32)
-        self.assertAlmostEqual(strategy.convert(100), 212)
-        self.assertAlmostEqual(strategy.convert(-40), -40)
-
-    def test_fahrenheit_to_celsius(self):
-        strategy = FahrenheitToCelsiusStrategy()
-        self.assertAlmostEqual(strategy.convert(32), 0)
-        self.assertAlmostEqual(strategy.convert(212), 100)
-        self.assertAlmostEqual(strategy.convert(-40), -40)
-
-    @given(st.floats(min_value=-1e6, max_value=1e6))
-    def test_property_miles_to_km(self, value):
-        """Property-based test for miles to kilometers."""
-        strategy = MilesToKmStrategy()
-        result = strategy.convert(value)
-        self.assertAlmostEqual(result, value * 1.60934)
-
-    @given(st.floats(min_value=-1e6, max_value=1e6))
-    def test_property_km_to_miles(self, value):
-        """Property-based test for kilometers to miles."""
-        strategy = KmToMilesStrategy()
-        result = strategy.convert(value)
-        self.assertAlmostEqual(result, value / 1.60934)
-
-    @given(st.floats(min_value=-1e6, max_value=1e6))
-    def test_in_to_cm(self, value):
-        """Property-based test for kilometers to miles."""
-        strategy = InchesToCentimetersStrategy()
-        result = strategy.convert(value)
-        self.assertAlmostEqual(result, value * 2.54)
-
-    @given(st.floats(min_value=-1e6, max_value=1e6))
-    def test_cm_to_in(self, value):
-        """Property-based test for kilometers to miles."""
-        strategy = CentimetersToInchesStrategy()
-        result = strategy.convert(value)
-        self.assertAlmostEqual(result, value * 0.3937)
-
-    @given(st.floats(min_value=-1e6, max_value=1e6))
-    def test_min_to_sec(self, value):
-        """Property-based test for kilometers to miles."""
-        strategy = MinutesToSecondsStrategy()
-        result = strategy.convert(value)
-        self.assertAlmostEqual(result, value * 60)
-
-    @given(st.floats(min_value=-1e6, max_value=1e6))
-    def test_sec_to_min(self, value):
-        """Property-based test for kilometers to miles."""
-        strategy = SecondsToMinutesStrategy()
-        result = strategy.convert(value)
-        self.assertAlmostEqual(result, value / 60)
-
-
-class TestConversionContext(unittest.TestCase):
-    """Tests for the ConversionContext class."""
-
-    def setUp(self) -> None:
-        self.context = ConversionContext()
-
-    def test_set_strategy(self):
-        strategy = MilesToKmStrategy()
-        self.context.set_strategy(strategy)
-        self.assertEqual(self.context.strategy, strategy)
-
-    def test_execute_conversion_with_strategy(self):
-        self.context.set_strategy(MilesToKmStrategy())
-        result = self.context.execute_conversion(1)
-        self.assertAlmostEqual(result, 1.60934)
-
-    def test_execute_conversion_without_strategy(self):
-        with self.assertRaises(ValueError):
-            self.context.execute_conversion(1)
-
-
-class TestCalculatorModes(unittest.TestCase):
-    """Tests for the Calculator Modes (Standard and Convert)."""
-
-    def test_standard_mode_buttons(self):
-        mode = StandardMode()
-        buttons = mode.create_buttons()
-        self.assertIn(('1', 3, 0), buttons)
-        self.assertIn(('=', 4, 3), buttons)
-        self.assertNotIn(('Mi to Km', 0, 0), buttons)
-
-    def test_convert_mode_buttons(self):
-        mode = ConvertMode()
-        buttons = mode.create_buttons()
-        self.assertIn(('Mi to Km', 0, 0), buttons)
-        self.assertIn(('F to C', 0, 3), buttons)
-        self.assertNotIn(('=', 4, 3), buttons)
-
-
-class TestCalculatorMode(unittest.TestCase):
-    def test_create_buttons_not_implemented(self):
-        mode = CalculatorMode()
-        with self.assertRaises(NotImplementedError):
-            mode.create_buttons()
-
-
-class TestAppMediator(unittest.TestCase):
-    """Tests for the App Mediator class."""
-    def setUp(self):
-        """Set up the AppMediator with a real Tk instance."""
-        self.master = tk()  # Create a real Tk instance
-        self.mediator = AppMediator(self.master)
-
-        # Replace display and button_manager with mocks
-        self.mediator.display = Mock()
-        self.mediator.button_manager = Mock()
-
-    def tearDown(self):
-        self.master.destroy()
-
-    def test_set_standard_mode(self):
-        self.mediator.set_standard_mode()
-        self.assertIsInstance(self.mediator.mode, StandardMode)
-        self.assertEqual(self.mediator.button_manager.update_buttons.call_count, 1)
-
-    def test_set_convert_mode(self):
-        self.mediator.set_convert_mode()
-        self.assertIsInstance(self.mediator.mode, ConvertMode)
-        self.assertEqual(self.mediator.button_manager.update_buttons.call_count, 1)
-
-    def test_handle_clear(self):
-        with patch.object(self.mediator.calculator, 'clear') as mock_clear:
-            self.mediator.handle_clear()
-            mock_clear.assert_called_once()
-            self.mediator.display.update_display.assert_called_once_with("")
-
-    def test_handle_equal(self):
-        with patch.object(self.mediator.calculator, 'solve', return_value=42):
-            self.mediator.handle_equal()
-            self.assertEqual(self.mediator.calculator.solve.call_count, 1)
-            self.mediator.display.update_display.assert_called_once_with(42)
-
-    def test_handle_append(self):
-        with patch.object(self.mediator.calculator, 'append') as mock_append:
-            self.mediator.handle_append("5")
-            mock_append.assert_called_once_with("5")
-            self.mediator.display.update_display.assert_called_once_with(self.mediator.calculator.entry_value)
-
-    def test_handle_conversion(self):
-        self.mediator.calculator.entry_value = "10"
-        with patch.object(self.mediator.conversion_context, 'set_strategy') as mock_set_strategy, \
-             patch.object(self.mediator.conversion_context, 'execute_conversion', return_value=16.0934) as mock_execute_conversion:
-            self.mediator.handle_conversion("Mi to Km")
-            self.assertEqual(mock_set_strategy.call_count, 1)
-            self.assertEqual(mock_execute_conversion.call_count, 1)
-            self.mediator.display.update_display.assert_called_once_with(16.0934)
-
-    def test_handle_conversion_invalid_value(self):
-        self.mediator.calculator.entry_value = "invalid"
-        self.mediator.handle_conversion("Mi to Km")
-        self.mediator.display.update_display.assert_called_once_with("Error")
-
-
-class TestDisplay(unittest.TestCase):
-    """Tests for Display class methods that haven't been covered"""
-
-    def setUp(self):
-        self.master = tk()
-        self.mock_mediator = Mock()
-        self.display = Display(self.master, self.mock_mediator)
-        self.display.equation = StringVar()
-
-    @given(st.floats(allow_infinity=False, allow_nan=False))
-    def test_update_display_with_float(self, value):
-        self.display.update_display(value)
-        if isinstance(value, float):
-            if value.is_integer():
-                exp_val = str(int(value))
-            else:
-                exp_val = f"{value:.3f}"
+def test_solve_malformed_expressions(calc, expression):
+    calc.entry_value = expression
+    assert calc.solve() == "Error"
+
+
+def test_solve_rejects_non_arithmetic(calc):
+    calc.clear()
+    calc.append("__import__('os').getcwd()")
+    assert calc.solve() == "Error"
+
+
+@pytest.mark.parametrize("expression", ["1e3", "2^3", "1_000", "\u0663+1"])
+def test_solve_rejects_unsupported_characters(calc, expression):
+    calc.entry_value = expression
+    assert calc.solve() == "Error"
+
+
+def test_solve_reuses_parsed_expression(calc):
+    calc.clear()
+    calc.append("6*7")
+    assert calc.solve() == 42
+    hits = _compile.cache_info().hits
+    assert calc.solve() == 42
+    assert _compile.cache_info().hits == hits + 1
+
+
+@_HYPOTHESIS_GROUP
+@settings(max_examples=10)
+@given(st.text())
+def test_solve_random_expressions(calc, expression):
+    """Property-based test to ensure no crashes on arbitrary input."""
+    calc.entry_value = expression
+    assert isinstance(calc.solve(), (str, int, float))
+
+
+# Tests for conversion strategies.
+
+def test_convert_not_implemented():
+    strategy = ConversionStrategy()
+    with pytest.raises(NotImplementedError):
+        strategy.convert(5.6)
+
+
+def test_miles_to_km():
+    strategy = _MI2KM
+    assert isclose(strategy.convert(1), 1.60934, abs_tol=1e-9)
+    assert isclose(strategy.convert(0), 0, abs_tol=1e-9)
+    assert isclose(strategy.convert(-1), -1.60934, abs_tol=1e-9)
+
+
+def test_km_to_miles():
+    strategy = _KM2MI
+    assert isclose(strategy.convert(1.60934), 1, abs_tol=1e-9)
+    assert isclose(strategy.convert(0), 0, abs_tol=1e-9)
+    assert isclose(strategy.convert(-1.60934), -1, abs_tol=1e-9)
+
+
+def test_celsius_to_fahrenheit():
+    strategy = _C2F
+    assert isclose(strategy.convert(0), 32, abs_tol=1e-9)
+    assert isclose(strategy.convert(100), 212, abs_tol=1e-9)
+    assert isclose(strategy.convert(-40), -40, abs_tol=1e-9)
+
+
+def test_fahrenheit_to_celsius():
+    strategy = _F2C
+    assert isclose(strategy.convert(32), 0, abs_tol=1e-9)
+    assert isclose(strategy.convert(212), 100, abs_tol=1e-9)
+    assert isclose(strategy.convert(-40), -40, abs_tol=1e-9)
+
+
+def test_convert_batch():
+    values = [-1.0, 0.0, 1.0, 1e6]
+    convert = _MI2KM.convert
+    results = _MI2KM.convert_batch(values)
+    assert results == [convert(v) for v in values]
+    assert _KM2MI.convert_batch([]) == []
+
+
+def test_conversion_factors_match_strategies():
+    converters = {
+        "Mi to Km": _MI2KM.convert,
+        "Km to Mi": _KM2MI.convert,
+        "C to F": _C2F.convert,
+        "F to C": _F2C.convert,
+        "In to Cm": _IN2CM.convert,
+        "Cm to In": _CM2IN.convert,
+        "Min to Sec": _MIN2SEC.convert,
+        "Sec to Min": _SEC2MIN.convert,
+    }
+    assert set(converters) == set(_CONVERSION_FACTORS)
+    for operation, (scale, offset) in _CONVERSION_FACTORS.items():
+        convert = converters[operation]
+        for value in (-40, 0, 1, 212):
+            assert isclose(
+                value * scale + offset, convert(value), abs_tol=1e-9
+            ), operation
+
+
+_SCALES = [
+    pytest.param(_MI2KM, 1.60934, id="miles_to_km"),
+    pytest.param(_KM2MI, 1 / 1.60934, id="km_to_miles"),
+    pytest.param(_IN2CM, 2.54, id="in_to_cm"),
+    pytest.param(_CM2IN, 0.3937, id="cm_to_in"),
+    pytest.param(_MIN2SEC, 60, id="min_to_sec"),
+    pytest.param(_SEC2MIN, 1 / 60, id="sec_to_min"),
+]
+
+# 1001 evenly spaced values across [-1e6, 1e6].
+_SWEEP = [-1e6 + 2e3 * i for i in range(1001)]
+
+
+@pytest.mark.parametrize("value", [-1e6, -1.0, 0.0, 1.0, 1e6])
+@pytest.mark.parametrize("strategy, factor", _SCALES)
+def test_conversion_scale(strategy, factor, value):
+    """Each scaling conversion multiplies its input by a fixed factor."""
+    assert strategy.convert(value) == pytest.approx(value * factor)
+
+
+@pytest.mark.parametrize("strategy, factor", _SCALES)
+def test_conversion_scale_sweep(strategy, factor):
+    """Check a dense sweep of values with one batch call per strategy."""
+    expected = [value * factor for value in _SWEEP]
+    assert strategy.convert_batch(_SWEEP) == pytest.approx(expected)
+
+
+# Tests for the ConversionContext class.
+
+@pytest.fixture(scope="module")
+def _shared_context():
+    return ConversionContext()
+
+
+@pytest.fixture
+def context(_shared_context):
+    _shared_context.strategy = None
+    return _shared_context
+
+
+def test_set_strategy(context):
+    strategy = _MI2KM
+    context.set_strategy(strategy)
+    assert context.strategy == strategy
+
+
+def test_execute_conversion_with_strategy(context):
+    context.set_strategy(_MI2KM)
+    result = context.execute_conversion(1)
+    assert isclose(result, 1.60934, abs_tol=1e-9)
+
+
+def test_execute_conversion_without_strategy(context):
+    with pytest.raises(ValueError, match="No conversion strategy set"):
+        context.execute_conversion(1)
+
+
+# Tests for the Calculator Modes (Standard and Convert).
+
+_STANDARD_BUTTONS = frozenset(StandardMode().create_buttons())
+_CONVERT_BUTTONS = frozenset(ConvertMode().create_buttons())
+
+
+def test_standard_mode_buttons():
+    assert ('1', 3, 0, 0) in _STANDARD_BUTTONS
+    assert ('=', 4, 3, 0) in _STANDARD_BUTTONS
+    assert ('Mi to Km', 0, 0, 1) not in _STANDARD_BUTTONS
+
+
+def test_convert_mode_buttons():
+    assert ('Mi to Km', 0, 0, 1) in _CONVERT_BUTTONS
+    assert ('F to C', 0, 3, 1) in _CONVERT_BUTTONS
+    assert ('=', 4, 3, 0) not in _CONVERT_BUTTONS
+
+
+@pytest.mark.parametrize("mode", [StandardMode(), ConvertMode()],
+                         ids=["standard", "convert"])
+def test_button_kinds_match_conversions(mode):
+    """Only labels with a conversion factor are flagged as conversions."""
+    for text, _, _, kind in mode.create_buttons():
+        assert bool(kind) == (text in _CONVERSION_FACTORS), text
+
+
+def test_mode_buttons_are_shared():
+    assert StandardMode().create_buttons() is StandardMode.BUTTONS
+    assert ConvertMode().create_buttons() is ConvertMode.BUTTONS
+
+
+def test_create_buttons_not_implemented():
+    mode = CalculatorMode()
+    with pytest.raises(NotImplementedError):
+        mode.create_buttons()
+
+
+# Tests for the App Mediator class.
+
+@pytest.fixture
+def mediator(master):
+    """Set up the AppMediator on a window of the shared Tk root."""
+    mediator = AppMediator(master)
+
+    # Replace display and button_manager with mocks
+    mediator.display = Mock()
+    mediator.button_manager = Mock()
+    return mediator
+
+
+def test_set_standard_mode(mediator):
+    mediator.set_standard_mode()
+    assert isinstance(mediator.mode, StandardMode)
+    assert mediator.button_manager.update_buttons.call_count == 1
+
+
+def test_set_convert_mode(mediator):
+    mediator.set_convert_mode()
+    assert isinstance(mediator.mode, ConvertMode)
+    assert mediator.button_manager.update_buttons.call_count == 1
+
+
+def test_mode_switch_reuses_mode_instances(mediator):
+    standard = mediator.mode
+    mediator.set_convert_mode()
+    convert = mediator.mode
+    mediator.set_standard_mode()
+    assert mediator.mode is standard
+    mediator.set_convert_mode()
+    assert mediator.mode is convert
+
+
+def test_handle_clear(mediator):
+    with patch.object(CalculatorBase, 'clear') as mock_clear:
+        mediator.handle_clear()
+        mock_clear.assert_called_once()
+        mediator.display.update_display_str.assert_called_once_with("")
+
+
+def test_handle_equal(mediator):
+    with patch.object(CalculatorBase, 'solve', return_value=42):
+        mediator.handle_equal()
+        assert CalculatorBase.solve.call_count == 1
+        mediator.display.update_display_number.assert_called_once_with(42)
+
+
+def test_handle_equal_error(mediator):
+    with patch.object(CalculatorBase, 'solve', return_value="Error"):
+        mediator.handle_equal()
+        mediator.display.update_display_str.assert_called_once_with("Error")
+        mediator.display.update_display_number.assert_not_called()
+
+
+def test_handle_append(mediator):
+    with patch.object(CalculatorBase, 'append') as mock_append:
+        mediator.handle_append("5")
+        mock_append.assert_called_once_with("5")
+        mediator.display.update_display_str.assert_called_once_with(
+            mediator.calculator.entry_value)
+
+
+def test_handle_conversion(mediator):
+    mediator.calculator.entry_value = "10"
+    mediator.handle_conversion("Mi to Km")
+    mediator.display.update_display_number.assert_called_once()
+    result = mediator.display.update_display_number.call_args[0][0]
+    assert isclose(result, 16.0934, abs_tol=1e-9)
+
+
+def test_handle_conversion_invalid_value(mediator):
+    mediator.calculator.entry_value = "invalid"
+    mediator.handle_conversion("Mi to Km")
+    mediator.display.update_display_str.assert_called_once_with("Error")
+
+
+def test_handle_conversion_unknown_operation(mediator):
+    mediator.calculator.entry_value = "10"
+    mediator.handle_conversion("Km to Parsec")
+    mediator.display.update_display_str.assert_called_once_with("Error")
+    mediator.display.update_display_number.assert_not_called()
+
+
+# Tests for Display class methods that haven't been covered.
+
+@pytest.fixture(scope="module")
+def display(root):
+    # Module-scoped so the @given tests can share it; every test writes
+    # the displayed text before reading it back.
+    window = Toplevel(root)
+    display = Display(window, Mock())
+    display.equation = StringVar(window)
+    yield display
+    window.destroy()
+
+
+@_HYPOTHESIS_GROUP
+@given(st.floats(allow_infinity=False, allow_nan=False))
+def test_update_display_with_float(display, value):
+    display.update_display(value)
+    if isinstance(value, float):
+        if value.is_integer():
+            exp_val = str(int(value))
         else:
-            exp_val = str(value)
-        self.assertEqual(self.display.equation.get(), exp_val)
-
-    @given(st.integers())
-    def test_update_display_with_int(self, value):
-        self.display.update_display(value)
-        self.assertEqual(self.display.equation.get(), str(int(value)))
-
-    @given(st.text())
-    def test_update_display_with_str(self, value):
-        self.display.update_display(value)
-        self.assertEqual(self.display.equation.get(), value)
-
-    def test_update_display_with_edge_case_values(self):
-        self.display.update_display("")  # Empty string
-        self.assertEqual(self.display.equation.get(), "")
-        
-        self.display.update_display(0)  # Zero
-        self.assertEqual(self.display.equation.get(), "0")
-
-
-class TestButtonManager(unittest.TestCase):
-    """Tests for the ButtonManager class."""
-
-    def setUp(self):
-        self.master = tk()
-        self.mock_mediator = Mock()
-        self.mock_mediator.mode = Mock()
-        self.mock_mediator.mode.create_buttons.return_value = [
-            ("C", 0, 0),
-            ("=", 1, 1),
-            ("5", 2, 2),
-            ("Mi to Km", 3, 3),
-        ]
-        self.button_manager = ButtonManager(self.master, self.mock_mediator)
-
-    def tearDown(self):
-        self.master.destroy()
-        
-    def test_update_buttons_clears_existing_widgets(self):
-        """Ensure update_buttons destroys all existing widgets."""
-        # Mock existing widgets in the button_frame
-        mock_widget1 = Mock()
-        mock_widget2 = Mock()
-        self.button_manager.button_frame.winfo_children = Mock(
-            return_value=[mock_widget1, mock_widget2]
-        )
-
-        # Call update_buttons
-        self.button_manager.update_buttons()
-
-        # Ensure destroy was called for each widget
-        mock_widget1.destroy.assert_called_once()
-        mock_widget2.destroy.assert_called_once()
-
-    @patch("calculator.Button")
-    def test_create_standard_button_handles_clear(self, mock_button):
-        """Test 'C' button calls mediator's handle_clear."""
-        with patch.object(self.mock_mediator, "handle_clear") as mock_handle_clear:
-            self.button_manager.create_standard_button("C", 0, 0)
-            mock_button.assert_called_once_with(
-                self.button_manager.button_frame, width=7, height=4, text="C",
-                relief='flat', bg='#7A8450', activebackground='#AEBD93', fg='white',
-                bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
-                command=unittest.mock.ANY
-            )
-            # Simulate button click
-            command = mock_button.call_args[1]["command"]
-            command()  # Execute the button command
-            mock_handle_clear.assert_called_once()
-
-    @patch("calculator.Button")
-    def test_create_standard_button_handles_equal(self, mock_button):
-        """Test '=' button calls mediator's handle_equal."""
-        with patch.object(self.mock_mediator, "handle_equal") as mock_handle_equal:
-            self.button_manager.create_standard_button("=", 1, 1)
-            mock_button.assert_called_once_with(
-                self.button_manager.button_frame, width=7, height=4, text="=",
-                relief='flat', bg='#7A8450', activebackground='#AEBD93', fg='white',
-                bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
-                command=unittest.mock.ANY
-            )
-            # Simulate button click
-            command = mock_button.call_args[1]["command"]
-            command()  # Execute the button command
-            mock_handle_equal.assert_called_once()
-
-    @patch("calculator.Button")
-    def test_create_standard_button_handles_append(self, mock_button):
-        """Test a number button calls mediator's handle_append."""
-        with patch.object(self.mock_mediator, "handle_append") as mock_handle_append:
-            self.button_manager.create_standard_button("5", 2, 2)
-            mock_button.assert_called_once_with(
-                self.button_manager.button_frame, width=7, height=4, text="5",
-                relief='flat', bg='#7A8450', activebackground='#AEBD93', fg='white',
-                bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
-                command=unittest.mock.ANY
-            )
-            # Simulate button click
-            command = mock_button.call_args[1]["command"]
-            command()  # Execute the button command
-            mock_handle_append.assert_called_once_with("5")
-
-    @patch("calculator.Button")
-    def test_create_conversion_button_handles_conversion(self, mock_button):
-        """Test conversion button calls mediator's handle_conversion."""
-        with patch.object(self.mock_mediator, "handle_conversion") as mock_handle_conversion:
-            self.button_manager.create_conversion_button("Mi to Km", 3, 3)
-            mock_button.assert_called_once_with(
-                self.button_manager.button_frame, width=7, height=4, text="Mi to Km",
-                relief='flat', bg='white', activebackground='white', fg='black',
-                bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
-                command=unittest.mock.ANY
-            )
-            # Simulate button click
-            command = mock_button.call_args[1]["command"]
-            command()  # Execute the button command
-            mock_handle_conversion.assert_called_once_with("Mi to Km")
-
-
-
-if __name__ == "__main__":
-    unittest.main()
+            exp_val = f"{value:.3f}"
+    else:
+        exp_val = str(value)
+    assert display.equation.get() == exp_val
+
+
+@_HYPOTHESIS_GROUP
+@given(st.integers())
+def test_update_display_with_int(display, value):
+    display.update_display(value)
+    assert display.equation.get() == str(int(value))
+
+
+@_HYPOTHESIS_GROUP
+@given(st.text())
+def test_update_display_with_str(display, value):
+    display.update_display(value)
+    assert display.equation.get() == value
+
+
+def test_update_display_with_edge_case_values(display):
+    display.update_display("")  # Empty string
+    assert display.equation.get() == ""
+
+    display.update_display(0)  # Zero
+    assert display.equation.get() == "0"
+
+
+def test_update_display_str_and_number(display):
+    display.update_display_str("1+2")
+    assert display.equation.get() == "1+2"
+
+    display.update_display_number(2.5)
+    assert display.equation.get() == "2.500"
+
+    display.update_display_number(3.0)
+    assert display.equation.get() == "3"
+
+
+def test_update_display_number_cache_is_bounded(display):
+    for value in range(100):
+        display.update_display_number(value + 0.5)
+    assert len(display._fmt_cache) <= 32
+    display.update_display_number(99.5)
+    assert display.equation.get() == "99.500"
+
+
+# Tests for the ButtonManager class.
+
+@pytest.fixture
+def mock_mediator():
+    mock_mediator = Mock()
+    mock_mediator.mode = StandardMode()
+    return mock_mediator
+
+
+@pytest.fixture
+def button_manager(master, mock_mediator):
+    return ButtonManager(master, mock_mediator)
+
+
+def test_update_buttons_switches_layout_frame(button_manager, mock_mediator):
+    """Ensure update_buttons swaps frames instead of rebuilding buttons."""
+    std_children = button_manager._std_frame.winfo_children()
+    conv_children = button_manager._conv_frame.winfo_children()
+    assert len(std_children) == 20
+    assert len(conv_children) == 20
+
+    def assert_shown(shown, hidden):
+        # Only the shown layout may be placed at all; a hidden one that
+        # stayed placed would still be reachable with Tab.
+        button_manager.button_frame.update_idletasks()
+        assert shown.place_info()
+        assert not hidden.place_info()
+        assert not hidden.winfo_ismapped()
+
+    assert_shown(button_manager._std_frame, button_manager._conv_frame)
+
+    mock_mediator.mode = ConvertMode()
+    button_manager.update_buttons()
+    assert_shown(button_manager._conv_frame, button_manager._std_frame)
+
+    mock_mediator.mode = StandardMode()
+    button_manager.update_buttons()
+    assert_shown(button_manager._std_frame, button_manager._conv_frame)
+    assert button_manager._std_frame.winfo_children() == std_children
+
+    with patch.object(button_manager._std_frame, 'place') as mock_place:
+        button_manager.update_buttons()
+        mock_place.assert_not_called()
+
+
+@patch("calculator.Button")
+def test_create_standard_button_handles_clear(mock_button, button_manager,
+                                              mock_mediator):
+    """Test 'C' button calls mediator's handle_clear."""
+    button_manager.create_standard_button(
+        button_manager.button_frame, "C", 0, 0)
+    mock_button.assert_called_once_with(
+        button_manager.button_frame, width=7, height=4, text="C",
+        relief='flat', bg='#7A8450', activebackground='#AEBD93', fg='white',
+        bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
+        command=ANY
+    )
+    # Simulate button click
+    command = mock_button.call_args[1]["command"]
+    command()  # Execute the button command
+    mock_mediator.handle_clear.assert_called_once()
+
+
+@patch("calculator.Button")
+def test_create_standard_button_handles_equal(mock_button, button_manager,
+                                              mock_mediator):
+    """Test '=' button calls mediator's handle_equal."""
+    button_manager.create_standard_button(
+        button_manager.button_frame, "=", 1, 1)
+    mock_button.assert_called_once_with(
+        button_manager.button_frame, width=7, height=4, text="=",
+        relief='flat', bg='#7A8450', activebackground='#AEBD93', fg='white',
+        bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
+        command=ANY
+    )
+    # Simulate button click
+    command = mock_button.call_args[1]["command"]
+    command()  # Execute the button command
+    mock_mediator.handle_equal.assert_called_once()
+
+
+@patch("calculator.Button")
+def test_create_standard_button_handles_append(mock_button, button_manager,
+                                               mock_mediator):
+    """Test a number button calls mediator's handle_append."""
+    button_manager.create_standard_button(
+        button_manager.button_frame, "5", 2, 2)
+    mock_button.assert_called_once_with(
+        button_manager.button_frame, width=7, height=4, text="5",
+        relief='flat', bg='#7A8450', activebackground='#AEBD93', fg='white',
+        bd=0, highlightbackground='#484F2B', highlightcolor='#7A8450',
+        command=ANY
+    )
+    # Simulate button click
+    command = mock_button.call_args[1]["command"]
+    command()  # Execute the button command
+    mock_mediator.handle_append.assert_called_once_with("5")
+
+
+@patch("calculator.Button")
+def test_create_conversion_button_handles_conversion(mock_button,
+                                                     button_manager,
+                                                     mock_mediator):
+    """Test conversion button calls mediator's handle_conversion."""
+    button_manager.create_conversion_button(
+        button_manager.button_frame, "Mi to Km", 3, 3)
+    mock_button.assert_called_once_with(
+        button_manager.button_frame, width=7, height=4, text="Mi to Km",
+        relief='flat', bg='#AEBD93', activebackground='#7A8450', fg='black',
+        activeforeground='white', bd=0, highlightbackground='white',
+        highlightcolor='#7A8450', command=ANY
+    )
+    # Simulate button click
+    command = mock_button.call_args[1]["command"]
+    command()  # Execute the button command
+    mock_mediator.handle_conversion.assert_called_once_with("Mi to Km")